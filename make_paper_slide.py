@@ -5,100 +5,225 @@
 # - Atomic save with sanity checks
 
 import argparse
+import hashlib
+import io
+import json
 import os
+import re
+import socket
+import stat
+import zipfile
 from pathlib import Path
-from pptx import Presentation
-from pptx.util import Pt, Inches
-from pptx.enum.shapes import PP_PLACEHOLDER as PH
 import tempfile
 import time
 import sys
+import weakref
+
+# python-pptx is imported lazily by _import_pptx(): python-pptx + lxml take hundreds of ms
+# to load, which --help, argument errors and daemon --append clients never need.
+Presentation = Inches = PH = parse_xml = None
+
+# PP_PLACEHOLDER sets, filled in by _import_pptx()
+_TITLE_TYPES = _BODY_TYPES = _EXCLUDE_AS_BODY = frozenset()
+
+
+def _import_pptx():
+    """Import python-pptx and derive the module constants that depend on it (idempotent)."""
+    global Presentation, Inches, PH, parse_xml, _TITLE_TYPES, _BODY_TYPES, _EXCLUDE_AS_BODY
+    if Presentation is not None:
+        return
+    # python-pptx serializes parts through lxml's C tostring (compact, no pretty-print);
+    # fail fast with a clear message so the paperflow wrapper can try its fallback python.
+    try:
+        import lxml.etree  # noqa: F401
+        from pptx import Presentation
+        from pptx.util import Inches
+        from pptx.enum.shapes import PP_PLACEHOLDER as PH
+        from pptx.oxml import parse_xml
+    except ImportError as e:
+        sys.exit(f"× python-pptx/lxml is not importable from {sys.executable}: {e}")
+
+    _TITLE_TYPES = _ph_types("TITLE", "CENTER_TITLE", "VERTICAL_TITLE")
+    # Some themes misuse OBJECT as content; include it as body candidate.
+    _BODY_TYPES = _ph_types("BODY", "OBJECT", "VERTICAL_BODY")
+    _EXCLUDE_AS_BODY = _TITLE_TYPES | _ph_types(
+        "SUBTITLE", "DATE", "SLIDE_NUMBER", "FOOTER", "HEADER"
+    )
+    _tune_zip_writer()
+
+
+def _ph_types(*names):
+    """Frozenset of the PP_PLACEHOLDER members named, skipping any this pptx lacks."""
+    return frozenset(filter(None, (getattr(PH, n, None) for n in names)))
+
+
+# Zip tuning for saves: deflate level 1 instead of zlib's default 6, and store
+# already-compressed images as-is rather than running them through deflate again.
+_ZIP_LEVEL = 1
+_PRECOMPRESSED_RE = re.compile(r"^ppt/media/.*\.(png|jpe?g)$", re.IGNORECASE)
+
+
+def _tune_zip_writer():
+    """Patch python-pptx's zip writer to use _ZIP_LEVEL / ZIP_STORED per member."""
+    try:
+        from pptx.opc.serialized import _ZipPkgWriter
+    except ImportError:  # private API moved; keep python-pptx defaults
+        return
+
+    def write(self, pack_uri, blob):
+        name = pack_uri.membername
+        if _PRECOMPRESSED_RE.match(name):
+            self._zipf.writestr(name, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(name, blob, compresslevel=_ZIP_LEVEL)
+
+    _ZipPkgWriter.write = write
 
 
 def _pick_placeholders(slide):
     """Return (title_shape, body_shape) using strict placeholder kinds, with fallbacks."""
-    TITLE_TYPES = {
-        getattr(PH, "TITLE", None),
-        getattr(PH, "CENTER_TITLE", None),
-        getattr(PH, "VERTICAL_TITLE", None),
-    }
-    BODY_TYPES = {
-        getattr(PH, "BODY", None),
-        getattr(PH, "OBJECT", None),
-        getattr(PH, "VERTICAL_BODY", None),
-        # Some themes misuse OBJECT as content; include it as body candidate.
-    }
-    EXCLUDE_AS_BODY = {
-        getattr(PH, "TITLE", None),
-        getattr(PH, "CENTER_TITLE", None),
-        getattr(PH, "VERTICAL_TITLE", None),
-        getattr(PH, "SUBTITLE", None),
-        getattr(PH, "DATE", None),
-        getattr(PH, "SLIDE_NUMBER", None),
-        getattr(PH, "FOOTER", None),
-        getattr(PH, "HEADER", None),
-    }
+    # Single pass over the placeholders: resolve type and geometry once per shape,
+    # then classify from the local list.
+    entries = []
+    for ph in slide.placeholders:
+        pf = getattr(ph, "placeholder_format", None)
+        pht = pf.type if pf is not None else None
+        area = (ph.width or 0) * (ph.height or 0)
+        entries.append((ph, pht, ph.top or 0, area, hasattr(ph, "text_frame")))
 
     title_shape = None
     body_shape = None
 
-    # First pass: strict by type
-    for ph in slide.placeholders:
+    # Strict by type
+    for ph, pht, _top, _area, _has_tf in entries:
         if not getattr(ph, "is_placeholder", False):
             continue
-        pht = ph.placeholder_format.type
-        if pht in TITLE_TYPES and title_shape is None:
+        if pht in _TITLE_TYPES and title_shape is None:
             title_shape = ph
-            continue
-        if pht in BODY_TYPES and body_shape is None:
+        elif pht in _BODY_TYPES and body_shape is None:
             body_shape = ph
-            continue
 
     # Fallbacks: choose by geometry if still missing
     if title_shape is None:
-        text_phs = [ph for ph in slide.placeholders if hasattr(ph, "text_frame")]
+        text_phs = [e for e in entries if e[4]]
         if text_phs:
             # Prefer highest (smallest 'top'); break ties by larger area
-            title_shape = sorted(
-                text_phs, key=lambda s: (s.top, -(s.width * s.height))
-            )[0]
+            title_shape = min(text_phs, key=lambda e: (e[2], -e[3]))[0]
 
     if body_shape is None:
-        candidates = []
-        for ph in slide.placeholders:
-            if ph is title_shape:
-                continue
-            if getattr(ph, "placeholder_format", None):
-                if ph.placeholder_format.type in EXCLUDE_AS_BODY:
-                    continue
-            if hasattr(ph, "text_frame"):
-                candidates.append(ph)
+        candidates = [
+            e for e in entries
+            if e[0] is not title_shape and e[1] not in _EXCLUDE_AS_BODY and e[4]
+        ]
         if candidates:
             # Largest area that isn't the title/subtitle/date/footer/etc.
-            body_shape = max(candidates, key=lambda s: (s.width * s.height))
+            body_shape = max(candidates, key=lambda e: e[3])[0]
 
     return title_shape, body_shape
 
 
+# Pre-serialized "Next Action:" footer textbox; equivalent to add_textbox() at
+# (0.6in, 6.2in, 9.0in x 1.0in) followed by a "Next Action:" line and a level-1 "• " line.
+_NEXT_ACTION_XML = (
+    '<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<p:nvSpPr><p:cNvPr id="%(id)d" name="%(name)s"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="548640" y="5669280"/><a:ext cx="8229600" cy="914400"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    "<a:p><a:r><a:t>Next Action:</a:t></a:r></a:p>"
+    '<a:p><a:pPr lvl="1"/><a:r><a:t>\u2022 </a:t></a:r></a:p>'
+    "</p:txBody></p:sp>"
+)
+
+
+# Per-layout-part results of _layout_placeholder_idx; weak keys so an entry is freed
+# together with its package instead of pinning whole decks (and their media) in memory.
+_LAYOUT_PH_IDX = weakref.WeakKeyDictionary()
+
+
+def _layout_placeholder_idx(layout_part):
+    """Return (title_idx, body_idx) of the layout's strict TITLE/BODY placeholders, None if absent.
+
+    Mirrors the strict pass of _pick_placeholders; slides clone these placeholders with
+    the same idx. Keyed by the layout part since layout proxies are not hashable.
+    """
+    cached = _LAYOUT_PH_IDX.get(layout_part)
+    if cached is not None:
+        return cached
+    title_idx = body_idx = None
+    for ph in sorted(layout_part.slide_layout.placeholders, key=lambda ph: ph.placeholder_format.idx):
+        pf = ph.placeholder_format
+        if pf.type in _TITLE_TYPES and title_idx is None:
+            title_idx = pf.idx
+        elif pf.type in _BODY_TYPES and body_idx is None:
+            body_idx = pf.idx
+    _LAYOUT_PH_IDX[layout_part] = (title_idx, body_idx)
+    return title_idx, body_idx
+
+
+# Font sizes as <a:defRPr sz> values (hundredths of a point): 32pt title, 14pt body
+_SZ_TITLE = "3200"
+_SZ_BODY = "1400"
+
+
+def _set_font_size(p, sz):
+    """Same XML as `p.font.size = Pt(...)`, written straight to <a:pPr><a:defRPr sz>."""
+    p._p.get_or_add_pPr().get_or_add_defRPr().set("sz", sz)
+
+
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+# Control characters python-pptx writes as _xHHHH_ ("\t" and "\n" are kept as-is)
+_CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+_LINE_BREAK_RE = re.compile("\n|\v")
+
+
+def _xml_escape(text):
+    """Escape &, < and > for element text (what xml.sax.saxutils.escape does, without its imports)."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _para_xml(text, level, sz):
+    """<a:p> markup equivalent to setting p.text, p.level and the font size through python-pptx."""
+    runs = "<a:br/>".join(
+        "<a:r><a:t>%s</a:t></a:r>" % _xml_escape(_CTRL_CHARS_RE.sub(lambda m: "_x%04X_" % ord(m.group()), seg))
+        if seg
+        else ""
+        for seg in _LINE_BREAK_RE.split(text)
+    )
+    lvl = ' lvl="%d"' % level if level else ""
+    return '<a:p><a:pPr%s><a:defRPr sz="%s"/></a:pPr>%s</a:p>' % (lvl, sz, runs)
+
+
 def add_slide(prs, title, link, reason, usage, rel_label, app_label, layout_index):
     """Add a slide with a resolved title and structured body content."""
     # Obtain layout safely
-    try:
-        layout = prs.slide_layouts[layout_index]
-    except Exception:
-        print(f"⚠️ Layout index {layout_index} is invalid; falling back to 0", file=sys.stderr)
-        layout = prs.slide_layouts[0]
+    layouts = prs.slide_layouts
+    n = len(layouts)
+    if not (isinstance(layout_index, int) and 0 <= layout_index < n):
+        print(f"⚠️ Layout index {layout_index!r} is invalid (0..{n - 1}); falling back to 0", file=sys.stderr)
+        layout_index = 0
+    layout = layouts[layout_index]
 
     slide = prs.slides.add_slide(layout)
 
-    # Identify placeholders robustly
-    title_shape, body_shape = _pick_placeholders(slide)
+    # Identify placeholders: cached layout indices for the common title+body case,
+    # full classification otherwise
+    title_shape = body_shape = None
+    title_idx, body_idx = _layout_placeholder_idx(layout.part)
+    if title_idx is not None and body_idx is not None:
+        try:
+            title_shape, body_shape = slide.placeholders[title_idx], slide.placeholders[body_idx]
+        except KeyError:
+            pass
+    if title_shape is None:
+        title_shape, body_shape = _pick_placeholders(slide)
 
     # --- Title: always in the title area (or injected top-left if absent)
     if title_shape is not None and hasattr(title_shape, "text_frame"):
         title_shape.text = title or "(title pending)"
         try:
-            title_shape.text_frame.paragraphs[0].font.size = Pt(32)
+            _set_font_size(title_shape.text_frame.paragraphs[0], _SZ_TITLE)
         except Exception:
             pass
     else:
@@ -106,47 +231,61 @@ def add_slide(prs, title, link, reason, usage, rel_label, app_label, layout_inde
         tbox = slide.shapes.add_textbox(Inches(0.6), Inches(0.3), Inches(9.0), Inches(0.9))
         tf = tbox.text_frame
         tf.text = title or "(title pending)"
-        tf.paragraphs[0].font.size = Pt(32)
+        _set_font_size(tf.paragraphs[0], _SZ_TITLE)
 
     # --- Body: link + key bullets into the body placeholder (or injected box)
     if body_shape is not None and hasattr(body_shape, "text_frame"):
         body_tf = body_shape.text_frame
-        body_tf.clear()
     else:
         # Create our own body area if theme layout doesn't provide one
         body_tf = slide.shapes.add_textbox(Inches(0.6), Inches(1.4), Inches(6.7), Inches(5.0)).text_frame
 
-    # Line 1: Link
-    p0 = body_tf.paragraphs[0]
-    p0.text = f"Link: {link}" if link else "Link: (n/a)"
-    p0.font.size = Pt(14)
-
-    # Subsequent lines: Relevance, Application (only if present)
+    # Line 1: Link; subsequent lines: Relevance, Application (only if present)
+    paras = [_para_xml(f"Link: {link}" if link else "Link: (n/a)", 0, _SZ_BODY)]
     for label, val in [(rel_label, reason), (app_label, usage)]:
         if val:
-            p = body_tf.add_paragraph()
-            p.text = f"{label}: {val}"
-            p.level = 1
-            p.font.size = Pt(14)
+            paras.append(_para_xml(f"{label}: {val}", 1, _SZ_BODY))
+    # Build all body paragraphs with one parse and swap them in for the existing ones
+    frag = parse_xml('<a:txBody xmlns:a="%s">%s</a:txBody>' % (_A_NS, "".join(paras)))
+    txBody = body_tf._txBody
+    for p in txBody.p_lst:
+        txBody.remove(p)
+    txBody.extend(frag)
 
     # Footer helper area (optional empty bullet for next action)
-    tx = slide.shapes.add_textbox(Inches(0.6), Inches(6.2), Inches(9.0), Inches(1.0))
-    tf = tx.text_frame
-    tf.text = "Next Action:"
-    p = tf.add_paragraph()
-    p.text = "• "
-    p.level = 1
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    sp = parse_xml(_NEXT_ACTION_XML % {"id": shape_id, "name": f"TextBox {shape_id - 1}"})
+    shapes._spTree.insert_element_before(sp, "p:extLst")
+
+
+# Minimum step when the new deck's mtime would not advance past the old one's
+_MTIME_STEP_NS = 10_000_000
 
 
-def save_atomic(prs: Presentation, dest: Path):
+def _bump_mtime(new: Path, old: Path):
+    """Ensure `new` has a strictly later mtime than `old` so watchers see the change."""
+    try:
+        prev = old.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    st = new.stat()
+    if st.st_mtime_ns <= prev:
+        os.utime(new, ns=(st.st_atime_ns, prev + _MTIME_STEP_NS))
+
+
+def save_atomic(prs: "Presentation", dest: Path):
     """Save to a temp file and atomically replace the destination."""
     dest.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(prefix=dest.stem + "_", suffix=".pptx", dir=str(dest.parent), delete=False) as tmp:
-        tmp_path = Path(tmp.name)
+    tmp = tempfile.NamedTemporaryFile(prefix=dest.stem + "_", suffix=".pptx", dir=str(dest.parent), delete=False)
+    tmp_path = Path(tmp.name)
     try:
-        prs.save(str(tmp_path))
-        # Small sleep to avoid timestamp granularity issues on some filesystems
-        time.sleep(0.05)
+        with tmp:
+            prs.save(tmp)
+            # Make the new deck durable before the rename publishes it
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        _bump_mtime(tmp_path, dest)
         os.replace(str(tmp_path), str(dest))
     except Exception as e:
         try:
@@ -156,9 +295,316 @@ def save_atomic(prs: Presentation, dest: Path):
             raise e
 
 
+# Output file names keep letters/digits (any script), space, "_" and "-";
+# \w is exactly str.isalnum() plus "_", so Japanese titles survive as before.
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w -]")
+
+_SLIDE_PART_RE = re.compile(r"ppt/slides/slide\d+\.xml$")
+
+
+def count_slide_parts(path: Path) -> int:
+    """Count slide parts in a saved .pptx by reading only the zip central directory."""
+    with zipfile.ZipFile(path) as z:
+        return sum(1 for n in z.namelist() if _SLIDE_PART_RE.match(n))
+
+
+# Per-slide fields a --batch record may set; anything omitted falls back to the CLI value.
+_BATCH_KEYS = ("title", "link", "reason", "usage", "rel_label", "app_label", "layout_index")
+
+
+def load_batch(path: Path):
+    """Read slide specs from a JSON array or a JSONL file (one object per line)."""
+    text = path.read_text(encoding="utf-8")
+    if text.lstrip().startswith("["):
+        records = json.loads(text)
+    else:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    check_specs(records, path)
+    return records
+
+
+def check_specs(records, source):
+    """Raise ValueError unless every record is an object using only _BATCH_KEYS, with valid types."""
+    if not isinstance(records, list):
+        raise ValueError(f"{source}: expected a list of slide specs")
+    for i, rec in enumerate(records, 1):
+        if not isinstance(rec, dict):
+            raise ValueError(f"{source}: record {i} is not a JSON object")
+        unknown = set(rec) - set(_BATCH_KEYS)
+        if unknown:
+            raise ValueError(f"{source}: record {i} has unknown keys: {', '.join(sorted(unknown))}")
+        for key, val in rec.items():
+            if key == "layout_index":
+                if not isinstance(val, int) or isinstance(val, bool):
+                    raise ValueError(f"{source}: record {i}: layout_index must be an integer, got {val!r}")
+            elif not isinstance(val, str):
+                raise ValueError(f"{source}: record {i}: {key} must be a string, got {val!r}")
+
+
+_CACHE_DIR = Path.home() / ".cache" / "paperflow"
+
+
+def cached_theme(theme) -> Path:
+    """Return an uncompressed (ZIP_STORED) copy of `theme`, building it in _CACHE_DIR on first use.
+
+    Parsed python-pptx objects cannot be pickled, so the cache holds the next best thing: a zip
+    that loads without an inflate pass. Named theme-<path hash>-<mtime/size hash>.pptx, so
+    editing the theme invalidates it; older copies of the same theme are pruned when a new
+    one is written. Falls back to `theme` itself if the copy cannot be made.
+    """
+    src = Path(theme)
+    try:
+        st = src.stat()
+        path_key = hashlib.blake2b(str(src.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+        stamp_key = hashlib.blake2b(f"{st.st_mtime_ns}:{st.st_size}".encode("utf-8"), digest_size=8).hexdigest()
+        cached = _CACHE_DIR / f"theme-{path_key}-{stamp_key}.pptx"
+        if cached.exists():
+            return cached
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(prefix="theme-", suffix=".tmp", dir=str(_CACHE_DIR), delete=False)
+        try:
+            with tmp, zipfile.ZipFile(src) as zin, zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as zout:
+                for info in zin.infolist():
+                    zout.writestr(info.filename, zin.read(info))
+            os.replace(tmp.name, str(cached))
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+        for stale in _CACHE_DIR.glob(f"theme-{path_key}-*.pptx"):
+            if stale != cached:
+                stale.unlink(missing_ok=True)
+        return cached
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"⚠️ Theme cache unavailable ({e}); loading {theme} directly", file=sys.stderr)
+        return src
+
+
+def load_presentation(deck, theme):
+    """Load base presentation: existing deck > theme > blank."""
+    _import_pptx()
+    if deck and Path(deck).exists():
+        return Presentation(deck)
+    if theme and Path(theme).exists():
+        return Presentation(str(cached_theme(theme)))
+    return Presentation()
+
+
+def write_lines(lines):
+    """Emit `lines` to stdout with a single write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def report_deck(deck_path: Path, before, after, verify=False):
+    """Print the deck summary lines the paperflow wrapper expects."""
+    out_lines = [f"Deck: {deck_path}"]
+    if verify:
+        # Reopen to verify (zip listing only; no XML parse)
+        try:
+            after_check = count_slide_parts(deck_path)
+        except Exception:
+            after_check = -1
+        out_lines.append(f"Slides: {before} -> {after} (reopen: {after_check})")
+    else:
+        out_lines.append(f"Slides: {before} -> {after}")
+    try:
+        out_lines.append(f"Modified: {time.ctime(deck_path.stat().st_mtime)}")
+    except Exception:
+        pass
+    out_lines.append(str(deck_path))
+    write_lines(out_lines)
+
+
+# --- Daemon mode: keep one deck resident and append to it over a Unix socket.
+# Protocol: the client sends one JSON line {"deck": path, "slides": [spec, ...]} and
+# reads back one JSON line, either {"before": n, "after": m} or {"error": message}.
+# The deck is saved at the end of every request, so the file on disk is always current.
+
+
+def _bind_socket(sock_path: Path):
+    """Bind a listening Unix socket, replacing a stale one left by a dead daemon."""
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        srv.bind(str(sock_path))
+    except OSError as bind_err:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(sock_path))
+        except OSError:
+            # Only a dead daemon's socket may be replaced; never unlink anything else
+            try:
+                mode = os.lstat(sock_path).st_mode
+            except OSError:
+                srv.close()
+                raise RuntimeError(f"Cannot bind {sock_path}: {bind_err}")
+            if not stat.S_ISSOCK(mode):
+                srv.close()
+                raise RuntimeError(f"{sock_path} exists and is not a socket; refusing to replace it")
+            sock_path.unlink()
+            srv.bind(str(sock_path))
+        else:
+            srv.close()
+            raise RuntimeError(f"A daemon is already listening on {sock_path}")
+        finally:
+            probe.close()
+    srv.listen()
+    return srv
+
+
+def _serve_request(prs, deck_path: Path, line: bytes):
+    """Apply one request to `prs`; return (reply, touched) where touched means `prs` may have changed."""
+    touched = False
+    try:
+        req = json.loads(line)
+        if not isinstance(req, dict):
+            raise ValueError("request is not a JSON object")
+        if Path(req.get("deck", "")).resolve() != deck_path.resolve():
+            raise ValueError(f"daemon serves {deck_path}, not {req.get('deck')}")
+        specs = req.get("slides", [])
+        check_specs(specs, "request")
+        before = len(prs.slides)
+        touched = True
+        for spec in specs:
+            add_slide(prs, **spec)
+        after = len(prs.slides)
+        save_atomic(prs, deck_path)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}, touched
+    return {"before": before, "after": after}, touched
+
+
+def _deck_stamp(deck_path: Path):
+    """(inode, mtime_ns, size) of the deck on disk, or None if it does not exist yet."""
+    try:
+        st = deck_path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+# Seconds the daemon waits for a connected client to send its request line
+_REQUEST_TIMEOUT = 10.0
+
+
+def serve(deck_path: Path, theme, sock_path: Path, idle_timeout: float):
+    """Service append requests against a resident copy of the deck until idle for `idle_timeout` seconds."""
+    prs = load_presentation(str(deck_path), theme)
+    stamp = _deck_stamp(deck_path)
+    srv = _bind_socket(sock_path)
+    srv.settimeout(idle_timeout if idle_timeout > 0 else None)
+    print(f"Serving {deck_path} on {sock_path}", file=sys.stderr)
+    try:
+        while True:
+            reply, touched = {}, False
+            try:
+                conn, _ = srv.accept()
+            except socket.timeout:
+                break
+            try:
+                # Bound the read so one silent client cannot stall the daemon for everyone
+                conn.settimeout(_REQUEST_TIMEOUT)
+                with conn, conn.makefile("rwb") as f:
+                    line = f.readline()
+                    if not line.strip():
+                        continue  # liveness probe or client gone before sending
+                    if _deck_stamp(deck_path) != stamp:
+                        # Written by someone else (e.g. a local run); never save over their slides.
+                        prs = load_presentation(str(deck_path), theme)
+                    reply, touched = _serve_request(prs, deck_path, line)
+                    f.write(json.dumps(reply).encode("utf-8") + b"\n")
+                    f.flush()
+            except socket.timeout:
+                print(f"⚠️ Client sent no request within {_REQUEST_TIMEOUT:g}s; dropped", file=sys.stderr)
+            except OSError as e:
+                print(f"⚠️ Client connection dropped: {e}", file=sys.stderr)
+            if touched and "error" in reply:
+                # Failed after editing: partial slides may be in memory; resync from disk.
+                prs = load_presentation(str(deck_path), theme)
+            stamp = _deck_stamp(deck_path)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# Seconds an --append client waits on the daemon before appending locally instead
+_CLIENT_TIMEOUT = 30.0
+
+
+def send_to_daemon(sock_path: Path, deck_path: Path, specs):
+    """Send `specs` to a running daemon; return its reply, or None if it cannot be reached."""
+    cli = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    cli.settimeout(_CLIENT_TIMEOUT)
+    try:
+        cli.connect(str(sock_path))
+        with cli.makefile("rwb") as f:
+            # Resolve here: the daemon would otherwise resolve it against its own cwd
+            req = {"deck": str(deck_path.resolve()), "slides": specs}
+            f.write(json.dumps(req).encode("utf-8") + b"\n")
+            f.flush()
+            return json.loads(f.readline() or b"null")
+    except (OSError, ValueError):
+        # Not listening, exited or died mid-request, stuck, or sent a garbled reply
+        return None
+    finally:
+        cli.close()
+
+
+def safe_filename(name):
+    """File-system-safe stem for an output deck named after `name`."""
+    name = name if name.strip() else "paper"
+    return _UNSAFE_FILENAME_RE.sub("_", name)[:80]
+
+
+# Theme bytes held by each --batch-dir worker; read once in the pool initializer.
+_worker_theme = None
+
+
+def _init_worker(theme_path):
+    global _worker_theme
+    _import_pptx()
+    _worker_theme = Path(theme_path).read_bytes() if theme_path else None
+
+
+def _make_one(spec, out: Path):
+    prs = Presentation(io.BytesIO(_worker_theme)) if _worker_theme is not None else Presentation()
+    add_slide(prs, **spec)
+    save_atomic(prs, out)
+    return out
+
+
+def write_split(specs, theme, outdir: Path, jobs):
+    """Write each spec as its own single-slide deck in `outdir`, `jobs` processes at a time."""
+    outdir.mkdir(parents=True, exist_ok=True)
+    outs, seen = [], set()
+    for spec in specs:
+        stem = base = safe_filename(spec["title"])
+        n = 1
+        while stem in seen:
+            n += 1
+            stem = f"{base}_{n}"
+        seen.add(stem)
+        outs.append(outdir / f"{stem}.pptx")
+
+    _import_pptx()  # fail fast here rather than inside every worker
+    # Resolve the theme cache once here; on a cold cache every worker would rebuild it
+    theme_path = str(cached_theme(theme)) if theme and Path(theme).exists() else None
+    if jobs <= 1 or len(specs) <= 1:
+        _init_worker(theme_path)
+        return [_make_one(spec, out) for spec, out in zip(specs, outs)]
+    import concurrent.futures  # pulls in logging/threading; only --batch-dir needs it
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(jobs, len(specs)), initializer=_init_worker, initargs=(theme_path,)
+    ) as pool:
+        return list(pool.map(_make_one, specs, outs))
+
+
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--title", required=True)
+    ap.add_argument("--title", default=None, help="Slide title (required unless --batch is given)")
     ap.add_argument("--link", default="")
     ap.add_argument("--reason", default="")
     ap.add_argument("--usage", default="")
@@ -173,22 +619,63 @@ def main():
         default=int(os.environ.get("PAPERFLOW_PPT_LAYOUT", 1)),
         help="Layout index (0-based) inside the theme/deck",
     )
+    ap.add_argument(
+        "--verify",
+        action="store_true",
+        help="After saving --deck, recount its slides from the written file",
+    )
+    ap.add_argument(
+        "--batch",
+        default="",
+        help="JSON/JSONL file of slide specs to append in one run (keys: %s)" % ", ".join(_BATCH_KEYS),
+    )
+    ap.add_argument(
+        "--batch-dir",
+        default="",
+        help="With --batch: write each record as its own single-slide deck in this directory",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --batch-dir (default: CPU count)",
+    )
+    ap.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep --deck loaded and append slides sent by --append clients over --socket",
+    )
+    ap.add_argument(
+        "--append",
+        action="store_true",
+        help="Send slides to a running --daemon instead of loading --deck (falls back to a local append)",
+    )
+    ap.add_argument(
+        "--socket",
+        default=os.environ.get("PAPERFLOW_SOCKET", str(Path.home() / ".paperflow.sock")),
+        help="Unix socket used by --daemon/--append",
+    )
+    ap.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600.0,
+        help="Seconds without requests before --daemon exits (0 = never)",
+    )
     args = ap.parse_args()
 
-    # Load base presentation: existing deck > theme > blank
-    prs = None
-    if args.deck and Path(args.deck).exists():
-        prs = Presentation(args.deck)
-    elif args.theme and Path(args.theme).exists():
-        prs = Presentation(args.theme)
-    else:
-        prs = Presentation()
+    if (args.daemon or args.append) and not args.deck:
+        ap.error("--daemon/--append require --deck")
+    if args.batch_dir and (not args.batch or args.deck):
+        ap.error("--batch-dir requires --batch and cannot be combined with --deck")
+    if args.daemon:
+        try:
+            serve(Path(args.deck), args.theme, Path(args.socket).expanduser(), args.idle_timeout)
+        except RuntimeError as e:
+            ap.error(str(e))
+        return
 
-    # Append slide
-    before = len(prs.slides)
-    add_slide(
-        prs,
-        title=args.title,
+    defaults = dict(
+        title=args.title or "",
         link=args.link,
         reason=args.reason,
         usage=args.usage,
@@ -196,35 +683,51 @@ def main():
         app_label=args.app_label,
         layout_index=args.layout,
     )
+    if args.batch:
+        try:
+            specs = [{**defaults, **rec} for rec in load_batch(Path(args.batch))]
+        except (OSError, ValueError) as e:
+            ap.error(f"--batch: {e}")
+    elif args.title is not None:
+        specs = [defaults]
+    else:
+        ap.error("--title is required unless --batch is given")
+
+    if args.batch_dir:
+        outs = write_split(specs, args.theme, Path(args.batch_dir), args.jobs)
+        write_lines([f"Slides: 0 -> {len(outs)}"] + [str(out) for out in outs])
+        return
+
+    if args.append:
+        deck_path = Path(args.deck)
+        reply = send_to_daemon(Path(args.socket).expanduser(), deck_path, specs)
+        if reply is not None and "error" not in reply:
+            report_deck(deck_path, reply["before"], reply["after"], args.verify)
+            return
+        reason = reply["error"] if reply else f"daemon on {args.socket} unreachable"
+        print(f"⚠️ Daemon append failed ({reason}); appending locally", file=sys.stderr)
+
+    prs = load_presentation(args.deck, args.theme)
+
+    # Append slides, reusing the loaded presentation for the whole batch
+    before = len(prs.slides)
+    for spec in specs:
+        add_slide(prs, **spec)
     after = len(prs.slides)
 
     # Save: to deck if specified, otherwise create a single-slide file in outdir
     if args.deck:
         deck_path = Path(args.deck)
         save_atomic(prs, deck_path)
-        # Reopen to verify
-        try:
-            prs_check = Presentation(str(deck_path))
-            after_check = len(prs_check.slides)
-        except Exception:
-            after_check = -1
-        print(f"Deck: {deck_path}")
-        print(f"Slides: {before} -> {after} (reopen: {after_check})")
-        try:
-            print(f"Modified: {time.ctime(deck_path.stat().st_mtime)}")
-        except Exception:
-            pass
-        print(str(deck_path))
+        report_deck(deck_path, before, after, args.verify)
     else:
         outdir = Path(args.outdir)
         outdir.mkdir(parents=True, exist_ok=True)
-        # Safe file name based on title
-        safe_name = args.title if args.title.strip() else "paper"
-        safe_name = "".join(c if c.isalnum() or c in (" ", "_", "-") else "_" for c in safe_name)[:80]
+        # Safe file name based on title (or the batch file name)
+        safe_name = safe_filename(Path(args.batch).stem if args.batch else args.title)
         out = outdir / f"{safe_name}.pptx"
         save_atomic(prs, out)
-        print("Slides: 0 -> 1")
-        print(str(out))
+        write_lines([f"Slides: 0 -> {len(specs)}", str(out)])
 
 
 if __name__ == "__main__":